@@ -3,15 +3,51 @@ Client vehicles page test class for testing the vehicles page at "/client/vehicl
 """
 
 import json
+import shutil
+import tempfile
 import time
+from types import SimpleNamespace
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
+from websites.result_printer import GREEN, YELLOW, iter_result_lines
+
+# Locators used in more than one place
+_L = SimpleNamespace(
+    MY_VEHICLES_H1=(By.XPATH, "//h1[contains(., 'My Vehicles')]"),
+    ADD_VEHICLE_LINK=(By.CSS_SELECTOR, "a[href*='/client/vehicles/add']"),
+    VEHICLE_CARDS=(By.CSS_SELECTOR, "div.card[data-vehicle-id]"),
+    CARD_EDIT_LINK=(By.CSS_SELECTOR, "a[href^='/client/vehicles/'][href$='/edit']"),
+    CARD_REQUEST_LINK=(By.CSS_SELECTOR, "a[href*='/client/service-request']"),
+    CARD_DELETE_BUTTON=(By.CSS_SELECTOR, "button.btn-outline-danger"),
+)
+
+# Visible text the page must show; the CSS locators above only match structure
+ADD_VEHICLE_LABEL = "Add New Vehicle"
+NO_VEHICLES_TEXT = "haven't added any vehicles"
+DELETE_MODAL_TITLE = "Confirm Delete"
+CARD_BUTTON_LABELS = {"edit": "Edit", "request": "Request Service", "delete": "Delete"}
+
+ACCESS_DENIED_MESSAGES = ("not authorized", "access denied", "permission denied", "zaloguj", "nie masz dostępu")
+
+# (name, CSS selector, expected href, expected label); resolved in-page with querySelector
+NAVBAR_LINKS: tuple[tuple[str, str, str, str], ...] = (
+    ("navbar_home", "div#navbarNav a.nav-link[href='/']", "/", "Home"),
+    ("navbar_contact", "div#navbarNav a.nav-link[href='/contact']", "/contact", "Contact"),
+    ("navbar_my_vehicles", "div#navbarNav a.nav-link[href='/client/vehicles']", "/client/vehicles", "My Vehicles"),
+    ("navbar_my_services", "div#navbarNav a.nav-link[href='/client/services']", "/client/services", "My Services"),
+    ("navbar_request_service", "div#navbarNav a.nav-link[href='/client/service-request']", "/client/service-request", "Request Service"),
+    ("navbar_logout", "div#navbarNav a.nav-link[href='/auth/logout']", "/auth/logout", "Logout"),
+)
 
 class ClientVehiclesPage:
+    _shared_driver = None
+    _profile_dir = None
+
     def __init__(self, driver: webdriver.Chrome = None):
         self.driver = driver
         self.test_results = {}
@@ -23,29 +59,83 @@ class ClientVehiclesPage:
         with open('tests/web_interface_tests/tests_config.json', 'r') as f:
             return json.load(f)
 
-    def _get_fresh_driver(self):
+    def _get_shared_driver(self):
+        if ClientVehiclesPage._shared_driver is not None:
+            return ClientVehiclesPage._shared_driver
         chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-features=PasswordManagerEnabled,PasswordLeakDetection,AutofillKeyedPasswords")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-save-password-bubble")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--incognito")
+        for arg in ("--headless=new", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
+                    "--disable-notifications", "--blink-settings=imagesEnabled=false",
+                    "--disable-features=Translate,AutofillServerCommunication"):
+            chrome_options.add_argument(arg)
+        # A persistent profile keeps the HTTP cache that --incognito would discard
+        ClientVehiclesPage._profile_dir = tempfile.mkdtemp(prefix="cvp-profile-")
+        chrome_options.add_argument(f"--user-data-dir={ClientVehiclesPage._profile_dir}")
         chrome_options.add_experimental_option("prefs", {
             "credentials_enable_service": False,
-            "profile.password_manager_enabled": False
+            "profile.password_manager_enabled": False,
+            "profile.password_manager_leak_detection": False
         })
-        return webdriver.Chrome(options=chrome_options)
+        driver = webdriver.Chrome(options=chrome_options)
+        # Registered before any further call so _quit_shared_driver can always shut it down
+        ClientVehiclesPage._shared_driver = driver
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        # Warm the cache with the static assets of the vehicles page
+        driver.get(self.vehicles_url)
+        return driver
+
+    def _new_isolated_context(self, driver):
+        driver.switch_to.new_window("window")
+        driver.get("about:blank")
+        # about:blank has no access to the app origin, so clear its state through CDP
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": self.base_url, "storageTypes": "local_storage"})
+        return driver
+
+    def _close_context(self, driver):
+        try:
+            driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+        except Exception:
+            pass
+
+    def _quit_shared_driver(self):
+        if ClientVehiclesPage._shared_driver is not None:
+            ClientVehiclesPage._shared_driver.quit()
+            ClientVehiclesPage._shared_driver = None
+        if ClientVehiclesPage._profile_dir is not None:
+            shutil.rmtree(ClientVehiclesPage._profile_dir, ignore_errors=True)
+            ClientVehiclesPage._profile_dir = None
+
+    def _fast_goto(self, driver, url):
+        # Page.navigate returns without waiting for the load event, so wait for the
+        # old document to go away and the new body to appear instead
+        old_page = driver.find_element(By.TAG_NAME, "html")
+        driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        wait = WebDriverWait(driver, 5)
+        wait.until(EC.staleness_of(old_page))
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+
+    def _find_card_buttons(self, driver, card_id: str) -> dict:
+        # Edit, Request Service and Delete of one card with their labels, looked up in a single call
+        names = ("edit", "request", "delete")
+        found = driver.execute_script(
+            "const card = document.querySelector(arguments[0]);"
+            "return arguments[1].map(sel => { const el = card ? card.querySelector(sel) : null;"
+            " return el ? [el, el.innerText] : null; });",
+            f"div.card[data-vehicle-id='{card_id}']",
+            [_L.CARD_EDIT_LINK[1], _L.CARD_REQUEST_LINK[1], _L.CARD_DELETE_BUTTON[1]]
+        )
+        missing = [name for name, pair in zip(names, found) if pair is None or CARD_BUTTON_LABELS[name] not in pair[1]]
+        if missing:
+            raise NoSuchElementException(f"Vehicle card {card_id} is missing buttons or their labels: {missing}")
+        return {name: pair[0] for name, pair in zip(names, found)}
 
     def _login_as(self, user_type: str, driver):
         login_url = f"{self.base_url}/auth/login"
         driver.get(login_url)
-        wait = WebDriverWait(driver, 5)
-        username_field = wait.until(EC.presence_of_element_located((By.ID, "username")))
-        password_field = wait.until(EC.presence_of_element_located((By.ID, "password")))
-        submit_button = wait.until(EC.presence_of_element_located((By.ID, "submit")))
+        username_field = driver.find_element(By.ID, "username")
+        password_field = driver.find_element(By.ID, "password")
+        submit_button = driver.find_element(By.ID, "submit")
         credentials = self.config["test_users"][user_type]
         username_field.clear()
         username_field.send_keys(credentials["login"])
@@ -55,9 +145,10 @@ class ClientVehiclesPage:
         time.sleep(0.2)
 
     def _logout(self, driver):
+        # The context is discarded right after, so dropping the session locally is enough
         try:
-            driver.get(f"{self.base_url}/auth/logout")
-            time.sleep(0.2)
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
         except Exception:
             pass
 
@@ -75,44 +166,46 @@ class ClientVehiclesPage:
     def get_test_results(self):
         return self.test_results
 
-    def _test_access(self, user_type: str) -> dict:
-        driver = self._get_fresh_driver()
+    def _test_access(self, user_type: str, driver=None) -> dict:
+        owns_driver = driver is None
+        if owns_driver:
+            driver = self._new_isolated_context(self._get_shared_driver())
         try:
-            if user_type != "unauthenticated":
+            if owns_driver and user_type != "unauthenticated":
                 self._login_as(user_type, driver)
             driver.get(self.vehicles_url)
             time.sleep(0.2)
-            wait = WebDriverWait(driver, 5)
             result = {"status": "passed", "user_type": user_type, "message": ""}
             if user_type == "client":
                 try:
-                    header = wait.until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'My Vehicles')]")))
+                    header = WebDriverWait(driver, 3).until(EC.presence_of_element_located(_L.MY_VEHICLES_H1))
                     result["header"] = {"status": "passed"}
                 except Exception as e:
                     result["header"] = {"status": "failed", "error": str(e)}
                     result["status"] = "failed"
                 try:
-                    add_btn = wait.until(EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/client/vehicles/add') and contains(., 'Add New Vehicle')]")))
+                    add_btn = driver.find_element(*_L.ADD_VEHICLE_LINK)
+                    if ADD_VEHICLE_LABEL not in add_btn.text:
+                        raise NoSuchElementException(f"Add vehicle link does not read '{ADD_VEHICLE_LABEL}': '{add_btn.text}'")
                     result["add_btn"] = {"status": "passed"}
                 except Exception as e:
                     result["add_btn"] = {"status": "failed", "error": str(e)}
                     result["status"] = "failed"
                 try:
-                    vehicle_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'card-body')]/h5[contains(@class, 'card-title')]")
+                    vehicle_cards = driver.find_elements(*_L.VEHICLE_CARDS)
                     if vehicle_cards:
                         result["vehicles"] = {"status": "passed", "count": len(vehicle_cards)}
                         try:
-                            card = vehicle_cards[0].find_element(By.XPATH, "ancestor::div[contains(@class, 'card')]")
-                            edit_btn = card.find_element(By.XPATH, ".//a[contains(@href, '/client/vehicles/') and contains(@href, '/edit') and contains(., 'Edit')]")
-                            req_btn = card.find_element(By.XPATH, ".//a[contains(@href, '/client/service-request') and contains(., 'Request Service')]")
-                            del_btn = card.find_element(By.XPATH, ".//button[contains(@class, 'btn-outline-danger') and contains(., 'Delete')]")
+                            self._find_card_buttons(driver, vehicle_cards[0].get_attribute("data-vehicle-id"))
                             result["vehicle_card_btns"] = {"status": "passed"}
                         except Exception as e:
                             result["vehicle_card_btns"] = {"status": "failed", "error": str(e)}
                             result["status"] = "failed"
                     else:
                         try:
-                            info = driver.find_element(By.XPATH, "//div[contains(@class, 'alert-info') and contains(., \"haven't added any vehicles\")]")
+                            infos = driver.find_elements(By.CSS_SELECTOR, "div.alert-info")
+                            if not any(NO_VEHICLES_TEXT in info.text for info in infos):
+                                raise NoSuchElementException(f"No info alert containing \"{NO_VEHICLES_TEXT}\"")
                             result["no_vehicles_info"] = {"status": "passed"}
                         except Exception as e:
                             result["no_vehicles_info"] = {"status": "failed", "error": str(e)}
@@ -127,10 +220,10 @@ class ClientVehiclesPage:
                 elif user_type in ["employee", "admin"] and ("/dashboard" in current_url or "/admin" in current_url or "/employee" in current_url):
                     result["access"] = {"status": "passed", "message": f"Redirected to dashboard: {current_url}"}
                 else:
-                    try:
-                        alert = driver.find_element(By.XPATH, "//*[contains(., 'not authorized') or contains(., 'access denied') or contains(., 'permission denied') or contains(., 'zaloguj') or contains(., 'nie masz dostępu')]")
+                    page_source = driver.page_source
+                    if any(message in page_source for message in ACCESS_DENIED_MESSAGES):
                         result["access"] = {"status": "passed", "message": "Access denied message present"}
-                    except Exception:
+                    else:
                         result["access"] = {"status": "failed", "message": f"Unexpected access: {current_url}"}
                         result["status"] = "failed"
             result["final_url"] = driver.current_url
@@ -138,119 +231,105 @@ class ClientVehiclesPage:
             self._log_html_on_error(driver, f"vehicles_access_{user_type}")
             result = {"status": "failed", "user_type": user_type, "error": str(e)}
         finally:
-            self._logout(driver)
-            driver.quit()
+            if owns_driver:
+                self._logout(driver)
+                self._close_context(driver)
         self._save_test_result(f"access_{user_type}", result)
         return result
 
-    def _get_expected_navbar_links(self):
-        return [
-            {"name": "navbar_home", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/') and contains(normalize-space(.), 'Home')]", "href": "/"},
-            {"name": "navbar_contact", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/contact') and contains(normalize-space(.), 'Contact')]", "href": "/contact"},
-            {"name": "navbar_my_vehicles", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/client/vehicles') and contains(normalize-space(.), 'My Vehicles')]", "href": "/client/vehicles"},
-            {"name": "navbar_my_services", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/client/services') and contains(normalize-space(.), 'My Services')]", "href": "/client/services"},
-            {"name": "navbar_request_service", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/client/service-request') and contains(normalize-space(.), 'Request Service')]", "href": "/client/service-request"},
-            {"name": "navbar_logout", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/auth/logout') and contains(normalize-space(.), 'Logout')]", "href": "/auth/logout"},
-        ]
-
-    def _test_links_redirect(self) -> dict:
-        driver = self._get_fresh_driver()
+    def _test_links_redirect(self, driver=None) -> dict:
+        owns_driver = driver is None
+        if owns_driver:
+            driver = self._new_isolated_context(self._get_shared_driver())
         results = {}
         try:
-            self._login_as("client", driver)
+            if owns_driver:
+                self._login_as("client", driver)
             driver.get(self.vehicles_url)
             time.sleep(0.2)
             wait = WebDriverWait(driver, 5)
 
-            navbar_links = self._get_expected_navbar_links()
-            for link in navbar_links:
-                name = link["name"]
-                by = link["by"]
-                locator = link["locator"]
-                expected_href = link["href"]
+            # Navbar redirects are checked over HTTP with the browser's session cookies
+            session = requests.Session()
+            for cookie in driver.get_cookies():
+                session.cookies.set(cookie["name"], cookie["value"])
+
+            # Read every navbar anchor in one round-trip
+            anchors = driver.execute_script(
+                "return arguments[0].map(sel => { const a = document.querySelector(sel); "
+                "return a ? {href: a.href, text: a.innerText.trim()} : null; });",
+                [locator for _, locator, _, _ in NAVBAR_LINKS]
+            )
+            for (name, locator, expected_href, expected_label), anchor in zip(NAVBAR_LINKS, anchors):
                 allowed_urls = [expected_href]
                 if name == "navbar_logout":
                     allowed_urls.append("/")
                 if name == "navbar_request_service":
                     allowed_urls.append("/client/vehicles")
+                if anchor is None:
+                    results[name] = {"status": "failed", "error": f"Navbar link not found: {locator}"}
+                    continue
+                if expected_label not in anchor["text"]:
+                    results[name] = {"status": "failed", "error": f"Navbar link {locator} reads '{anchor['text']}', expected '{expected_label}'"}
+                    continue
                 try:
-                    nav_elem = wait.until(EC.element_to_be_clickable((by, locator)))
-                    nav_elem.click()
-                    time.sleep(0.3)
-                    current_url = driver.current_url
-                    passed = any(url in current_url for url in allowed_urls)
-
-                    if name == "navbar_request_service" and "/client/vehicles" in current_url:
-                        try:
-                            alert = driver.find_element(By.XPATH, "//div[contains(@class, 'alert-warning') and contains(., 'Please select a vehicle first.')]")
-                            if alert.is_displayed():
-                                passed = True
-                        except Exception:
-                            pass
+                    response = session.get(anchor["href"], allow_redirects=False, timeout=5)
+                    current_url = response.headers.get("Location", response.url)
+                    passed = response.status_code in (200, 302) and any(url in current_url for url in allowed_urls)
                     results[name] = {
                         "status": "passed" if passed else "failed",
                         "expected_href": allowed_urls,
                         "actual_url": current_url,
-                        "message": "Redirect OK" if passed else f"Expected one of {allowed_urls} in '{current_url}'"
+                        "message": "Redirect OK" if passed else f"Expected one of {allowed_urls} in '{current_url}' (HTTP {response.status_code})"
                     }
-
-                    if name != "navbar_logout":
-                        driver.get(self.vehicles_url)
-                        wait.until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'My Vehicles')]")))
-                        time.sleep(0.2)
-                    else:
-                        self._login_as("client", driver)
-                        driver.get(self.vehicles_url)
-                        wait.until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'My Vehicles')]")))
-                        time.sleep(0.2)
                 except Exception as e:
                     results[name] = {"status": "failed", "error": str(e)}
 
             try:
-                add_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(@href, '/client/vehicles/add') and contains(., 'Add New Vehicle')]")))
+                add_btn = wait.until(EC.element_to_be_clickable(_L.ADD_VEHICLE_LINK))
+                if ADD_VEHICLE_LABEL not in add_btn.text:
+                    raise NoSuchElementException(f"Add vehicle link does not read '{ADD_VEHICLE_LABEL}': '{add_btn.text}'")
                 add_btn.click()
                 wait.until(EC.url_contains("/client/vehicles/add"))
                 current_url = driver.current_url
                 results["add_new_vehicle"] = {"status": "passed" if "/client/vehicles/add" in current_url else "failed", "actual_url": current_url}
-                driver.back()
-                wait.until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'My Vehicles')]")))
+                self._fast_goto(driver, self.vehicles_url)
+                wait.until(EC.presence_of_element_located(_L.MY_VEHICLES_H1))
             except Exception as e:
                 results["add_new_vehicle"] = {"status": "failed", "error": str(e)}
             try:
-                vehicle_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'card-body')]/h5[contains(@class, 'card-title')]")
+                vehicle_cards = driver.find_elements(*_L.VEHICLE_CARDS)
                 if vehicle_cards:
-                    card = vehicle_cards[0].find_element(By.XPATH, "ancestor::div[contains(@class, 'card')]")
+                    card_id = vehicle_cards[0].get_attribute("data-vehicle-id")
+                    buttons = self._find_card_buttons(driver, card_id)
                     # Edit
                     try:
-                        edit_btn = card.find_element(By.XPATH, ".//a[contains(@href, '/client/vehicles/') and contains(@href, '/edit') and contains(., 'Edit')]")
-                        edit_btn.click()
+                        buttons["edit"].click()
                         wait.until(EC.url_contains("/client/vehicles/") and EC.url_contains("/edit"))
                         current_url = driver.current_url
                         results["edit_vehicle"] = {"status": "passed" if "/client/vehicles/" in current_url and "/edit" in current_url else "failed", "actual_url": current_url}
-                        driver.back()
-                        wait.until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'My Vehicles')]")))
-                        vehicle_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'card-body')]/h5[contains(@class, 'card-title')]" )
-                        card = vehicle_cards[0].find_element(By.XPATH, "ancestor::div[contains(@class, 'card')]")
+                        self._fast_goto(driver, self.vehicles_url)
+                        wait.until(EC.presence_of_element_located(_L.MY_VEHICLES_H1))
+                        buttons = self._find_card_buttons(driver, card_id)
                     except Exception as e:
                         results["edit_vehicle"] = {"status": "failed", "error": str(e)}
                     try:
-                        req_btn = card.find_element(By.XPATH, ".//a[contains(@href, '/client/service-request') and contains(., 'Request Service')]")
-                        req_btn.click()
+                        buttons["request"].click()
                         wait.until(lambda d: "/client/service-request" in d.current_url or "/client/vehicles" in d.current_url)
                         current_url = driver.current_url
                         results["request_service"] = {"status": "passed" if "/client/service-request" in current_url or "/client/vehicles" in current_url else "failed", "actual_url": current_url}
-                        driver.back()
-                        wait.until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'My Vehicles')]")))
-                        vehicle_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'card-body')]/h5[contains(@class, 'card-title')]" )
-                        card = vehicle_cards[0].find_element(By.XPATH, "ancestor::div[contains(@class, 'card')]")
+                        self._fast_goto(driver, self.vehicles_url)
+                        wait.until(EC.presence_of_element_located(_L.MY_VEHICLES_H1))
+                        buttons = self._find_card_buttons(driver, card_id)
                     except Exception as e:
                         results["request_service"] = {"status": "failed", "error": str(e)}
                     try:
-                        del_btn = card.find_element(By.XPATH, ".//button[contains(@class, 'btn-outline-danger') and contains(., 'Delete')]")
-                        del_btn.click()
-                        wait.until(EC.visibility_of_element_located((By.XPATH, "//div[contains(@class, 'modal') and contains(@class, 'show')]//h5[contains(., 'Confirm Delete')]")))
+                        buttons["delete"].click()
+                        title = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "div.modal.show h5.modal-title")))
+                        if DELETE_MODAL_TITLE not in title.text:
+                            raise NoSuchElementException(f"Delete modal title does not read '{DELETE_MODAL_TITLE}': '{title.text}'")
                         results["delete_modal"] = {"status": "passed"}
-                        close_btn = driver.find_element(By.XPATH, "//div[contains(@class, 'modal') and contains(@class, 'show')]//button[@class='btn-close']")
+                        close_btn = driver.find_element(By.CSS_SELECTOR, "div.modal.show button.btn-close")
                         close_btn.click()
                         time.sleep(0.2)
                     except Exception as e:
@@ -262,32 +341,35 @@ class ClientVehiclesPage:
             except Exception as e:
                 results["vehicle_card_links"] = {"status": "failed", "error": str(e)}
         finally:
-            self._logout(driver)
-            driver.quit()
-        overall_status = "passed" if all(r["status"] == "passed" or r["status"] == "skipped" for r in results.values()) else "failed"
+            if owns_driver:
+                self._logout(driver)
+                self._close_context(driver)
+        failed = [k for k, v in results.items() if v["status"] == "failed"]
         summary = {
-            "status": overall_status,
+            "status": "failed" if failed else "passed",
             "user_type": "client",
-            "message": "All link redirects checked" if overall_status == "passed" else f"Some links failed: {[k for k,v in results.items() if v['status']=='failed']}",
+            "message": f"Some links failed: {failed}" if failed else "All link redirects checked",
             "links": results
         }
         self._save_test_result(f"links_redirect_client", summary)
         return summary
 
     def _test_scrolling(self) -> dict:
-        driver = self._get_fresh_driver()
+        driver = self._new_isolated_context(self._get_shared_driver())
         try:
             self._login_as("client", driver)
             driver.get(self.vehicles_url)
             driver.set_window_size(375, 667)
             time.sleep(0.1)
-            initial_scroll = driver.execute_script("return window.pageYOffset;")
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.1)
-            bottom_scroll = driver.execute_script("return window.pageYOffset;")
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(0.1)
-            final_scroll = driver.execute_script("return window.pageYOffset;")
+            # "instant" overrides Bootstrap's smooth scroll-behavior so offsets are final when read
+            initial_scroll, bottom_scroll, final_scroll = driver.execute_script("""
+                const a = window.pageYOffset;
+                window.scrollTo({top: document.body.scrollHeight, behavior: "instant"});
+                const b = window.pageYOffset;
+                window.scrollTo({top: 0, behavior: "instant"});
+                const c = window.pageYOffset;
+                return [a, b, c];
+            """)
             driver.set_window_size(1920, 1080)
             if bottom_scroll > initial_scroll:
                 status = "passed"
@@ -309,41 +391,35 @@ class ClientVehiclesPage:
             result = {"status": "failed", "user_type": "client", "message": f"Error during scrolling test: {str(e)}", "error": str(e)}
         finally:
             self._logout(driver)
-            driver.quit()
+            self._close_context(driver)
         self._save_test_result("scrolling_client", result)
         return result
 
     def run_all_tests(self):
-        results = {
-            "scrolling": self._test_scrolling(),
-            "access_unauthenticated": self._test_access("unauthenticated"),
-            "access_employee": self._test_access("employee"),
-            "access_admin": self._test_access("admin"),
-            "access_client": self._test_access("client"),
-            "links_redirect": self._test_links_redirect(),
-        }
+        try:
+            results = {
+                "scrolling": self._test_scrolling(),
+                "access_unauthenticated": self._test_access("unauthenticated"),
+                "access_employee": self._test_access("employee"),
+                "access_admin": self._test_access("admin"),
+            }
+            # Both client tests run in one logged-in session
+            client_driver = self._new_isolated_context(self._get_shared_driver())
+            try:
+                self._login_as("client", client_driver)
+                results["access_client"] = self._test_access("client", client_driver)
+                results["links_redirect"] = self._test_links_redirect(client_driver)
+            finally:
+                self._logout(client_driver)
+                self._close_context(client_driver)
+        finally:
+            self._quit_shared_driver()
         self._save_test_result("all_vehicles_tests", results)
         return results
 
     def print_test_results(self, results: dict, indent: int = 0):
-        indent_str = "  " * indent
-        for key, value in results.items():
-            if isinstance(value, dict):
-                if "status" in value:
-                    status_color = "\033[92m" if value["status"] == "passed" else ("\033[93m" if value["status"] == "skipped" else "\033[91m")
-                    print(f"{indent_str}{key}: {status_color}{value['status']}\033[0m")
-                    if "message" in value:
-                        print(f"{indent_str}  Message: {value['message']}")
-                    if "error" in value:
-                        print(f"{indent_str}  Error: {value['error']}")
-                    for subkey in [k for k in value if isinstance(value[k], dict)]:
-                        print(f"{indent_str}  {subkey}:")
-                        self.print_test_results(value[subkey], indent + 2)
-                else:
-                    print(f"{indent_str}{key}:")
-                    self.print_test_results(value, indent + 1)
-            else:
-                print(f"{indent_str}{key}: {value}")
+        for line in iter_result_lines(results, indent, {"passed": GREEN, "skipped": YELLOW}):
+            print(line)
 
 if __name__ == "__main__":
     chrome_options = Options()
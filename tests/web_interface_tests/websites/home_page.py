@@ -3,7 +3,12 @@ Home page test class for testing the main page at "/"
 """
 
 import json
+import os
+import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,37 +16,297 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from typing import Dict, Any
 from selenium.webdriver.chrome.options import Options
+from websites.result_printer import iter_result_lines
+
+CONFIG_PATH = 'tests/web_interface_tests/tests_config.json'
+
+# Parsed once at import; stays None when the file is not reachable from the import-time cwd
+try:
+    with open(CONFIG_PATH, 'r') as f:
+        _CONFIG = json.load(f)
+except (OSError, ValueError):
+    _CONFIG = None
+
+# Persistent profiles keep Chrome's HTTP cache for static assets between drivers and runs
+# Chrome locks a profile per process, so concurrent runs must point this at different directories
+CACHE_DIR = os.environ.get("CARSERVICE_SELENIUM_CACHE_DIR", "/tmp/carservice_selenium_cache")
+
+# Shared by drivers that launch their own Chrome and by the browsers started in setup_once.
+# The home page checks only read the DOM, so skip rendering work and subresource loads
+CHROME_ARGS = [
+    "--headless=new",
+    # Headless defaults to 800x600, below the navbar-expand-lg breakpoint that collapses #navbarNav
+    "--window-size=1920,1080",
+    "--disable-gpu",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--mute-audio",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-features=PasswordManagerEnabled,PasswordLeakDetection,AutofillKeyedPasswords",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-save-password-bubble",
+    "--disable-notifications",
+    "--disable-popup-blocking",
+]
+
+CHROME_BINARY = os.environ.get("CHROME_BINARY", "google-chrome")
+
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.woff", "*.woff2", "*.ttf"]
+
+# Resolves every expected element in one round-trip and returns {name: props or null}
+ELEMENT_PROPS_JS = """
+const results = {};
+for (const spec of arguments[0]) {
+    const el = spec.xpath
+        ? document.evaluate(spec.locator, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(spec.locator);
+    if (!el) {
+        results[spec.name] = null;
+        continue;
+    }
+    results[spec.name] = {
+        visible: el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden',
+        text: el.innerText,
+        href: el.href || el.getAttribute('href'),
+        enabled: !el.disabled
+    };
+}
+return results;
+"""
+
+# Fetches every link's href from the page and resolves with [{name, url, http_status} or {name, error}]
+LINK_REDIRECTS_JS = """
+const [links, done] = arguments;
+const locate = (spec) => spec.xpath
+    ? document.evaluate(spec.locator, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(spec.locator);
+const probe = (link) => {
+    const el = locate(link);
+    if (!el || !el.href) {
+        return Promise.resolve({name: link.name, error: `Element not found: ${link.locator}`});
+    }
+    return fetch(el.href, {method: 'HEAD', credentials: 'include'})
+        .then(r => ({name: link.name, url: r.url, http_status: r.status}))
+        .catch(e => ({name: link.name, error: String(e)}));
+};
+(async () => {
+    // Links that end the session run after the rest so they cannot race them
+    const results = await Promise.all(links.filter(l => !l.last).map(probe));
+    for (const link of links.filter(l => l.last)) {
+        results.push(await probe(link));
+    }
+    done(results);
+})();
+"""
+
+# Landmarks reported by the page load and visibility checks
+PAGE_ELEMENTS = (
+    ("navbar", By.CLASS_NAME, "navbar"),
+    ("welcome_header", By.XPATH, "//h1[contains(text(), 'Welcome to CarService') or contains(text(), 'CarService') or contains(@class, 'display-4') or contains(@class, 'display')]"),
+    ("footer", By.CLASS_NAME, "footer"),
+)
+
+# Expected home page elements per role, built once at import
+_EXPECTED_UNAUTH = (
+    {"name": "header_welcome", "by": By.CSS_SELECTOR, "locator": "h1.display-4", "text": "Welcome to CarService"},
+    {"name": "lead_paragraph", "by": By.CSS_SELECTOR, "locator": "p.lead", "text": "Professional car maintenance and repair services."},
+    {"name": "card_register_title", "by": By.XPATH, "locator": "//h5[contains(., 'Register') and not(contains(., 'User'))]", "text": "Register"},
+    {"name": "card_register_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/auth/register']", "text": "Register Now", "href": "/auth/register"},
+    {"name": "card_signin_title", "by": By.XPATH, "locator": "//h5[contains(., 'Sign In')]", "text": "Sign In"},
+    {"name": "card_signin_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/auth/login']", "text": "Sign In", "href": "/auth/login"},
+    {"name": "card_contact_title", "by": By.XPATH, "locator": "//h5[contains(., 'Contact Us')]", "text": "Contact Us"},
+    {"name": "card_contact_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/contact']", "text": "Contact Support", "href": "/contact"},
+    {"name": "navbar_home", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href='/']", "text": "Home", "href": "/"},
+    {"name": "navbar_contact", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/contact']", "text": "Contact", "href": "/contact"},
+    {"name": "navbar_login", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/auth/login']", "text": "Login", "href": "/auth/login"},
+    {"name": "navbar_register", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/auth/register']", "text": "Register", "href": "/auth/register"},
+    {"name": "footer", "by": By.CLASS_NAME, "locator": "footer"}
+)
+
+_EXPECTED_CLIENT = (
+    {"name": "header_welcome", "by": By.CSS_SELECTOR, "locator": "h1.display-4", "text": "Welcome to CarService"},
+    {"name": "lead_paragraph", "by": By.CSS_SELECTOR, "locator": "p.lead", "text": "Professional car maintenance and repair services."},
+    # My Vehicles card
+    {"name": "card_my_vehicles_title", "by": By.XPATH, "locator": "//h5[contains(., 'My Vehicles')]", "text": "My Vehicles"},
+    {"name": "card_my_vehicles_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/client/vehicles']", "text": "View Vehicles", "href": "/client/vehicles"},
+    # My Services card
+    {"name": "card_my_services_title", "by": By.XPATH, "locator": "//h5[contains(., 'My Services')]", "text": "My Services"},
+    {"name": "card_my_services_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/client/services']", "text": "View Services", "href": "/client/services"},
+    # Request Service card
+    {"name": "card_request_service_title", "by": By.XPATH, "locator": "//h5[contains(., 'Request Service')]", "text": "Request Service"},
+    {"name": "card_request_service_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/client/service-request']", "text": "New Service", "href": "/client/service-request"},
+    # Contact Us card (dla klienta też jest)
+    {"name": "card_contact_title", "by": By.XPATH, "locator": "//h5[contains(., 'Contact Us')]", "text": "Contact Us"},
+    {"name": "card_contact_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/contact']", "text": "Contact Support", "href": "/contact"},
+    # Navbar
+    {"name": "navbar_home", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href='/']", "text": "Home", "href": "/"},
+    {"name": "navbar_contact", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/contact']", "text": "Contact", "href": "/contact"},
+    {"name": "navbar_my_vehicles", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/client/vehicles']", "text": "My Vehicles", "href": "/client/vehicles"},
+    {"name": "navbar_my_services", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/client/services']", "text": "My Services", "href": "/client/services"},
+    {"name": "navbar_request_service", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/client/service-request']", "text": "Request Service", "href": "/client/service-request"},
+    {"name": "navbar_logout", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/auth/logout']", "text": "Logout", "href": "/auth/logout"},
+    {"name": "footer", "by": By.CLASS_NAME, "locator": "footer"}
+)
+
+_EXPECTED_EMPLOYEE = (
+    {"name": "header_welcome", "by": By.CSS_SELECTOR, "locator": "h1.display-4", "text": "Welcome to CarService"},
+    {"name": "lead_paragraph", "by": By.CSS_SELECTOR, "locator": "p.lead", "text": "Professional car maintenance and repair services."},
+    # Service Management card
+    {"name": "card_service_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'Service Management') and not(contains(., 'User')) and not(contains(., 'Vehicle'))]", "text": "Service Management"},
+    {"name": "card_service_management_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/employee/services']", "text": "Manage Services", "href": "/employee/services"},
+    # Vehicle List card
+    {"name": "card_vehicle_list_title", "by": By.XPATH, "locator": "//h5[contains(., 'Vehicle List')]", "text": "Vehicle List"},
+    {"name": "card_vehicle_list_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/employee/vehicles']", "text": "View Vehicles", "href": "/employee/vehicles"},
+    # Client Management card
+    {"name": "card_client_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'Client Management')]", "text": "Client Management"},
+    {"name": "card_client_management_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/employee/users']", "text": "Manage Clients", "href": "/employee/users"},
+    # Navbar
+    {"name": "navbar_home", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href='/']", "text": "Home", "href": "/"},
+    {"name": "navbar_dashboard", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/employee/dashboard']", "text": "Dashboard", "href": "/employee/dashboard"},
+    {"name": "navbar_services", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/employee/services']", "text": "Services", "href": "/employee/services"},
+    {"name": "navbar_users", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/employee/users']", "text": "Users", "href": "/employee/users"},
+    {"name": "navbar_vehicles", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/employee/vehicles']", "text": "Vehicles", "href": "/employee/vehicles"},
+    {"name": "navbar_logout", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/auth/logout']", "text": "Logout", "href": "/auth/logout"},
+    {"name": "footer", "by": By.CLASS_NAME, "locator": "footer"}
+)
+
+_EXPECTED_ADMIN = (
+    {"name": "header_welcome", "by": By.CSS_SELECTOR, "locator": "h1.display-4", "text": "Welcome to CarService"},
+    {"name": "lead_paragraph", "by": By.CSS_SELECTOR, "locator": "p.lead", "text": "Professional car maintenance and repair services."},
+    # User Management card
+    {"name": "card_user_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'User Management')]", "text": "User Management"},
+    {"name": "card_user_management_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/admin/users']", "text": "Manage Users", "href": "/admin/users"},
+    # Vehicle Management card
+    {"name": "card_vehicle_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'Vehicle Management')]", "text": "Vehicle Management"},
+    {"name": "card_vehicle_management_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/admin/vehicles']", "text": "Manage Vehicles", "href": "/admin/vehicles"},
+    # Service Management card
+    {"name": "card_service_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'Service Management')]", "text": "Service Management"},
+    {"name": "card_service_management_btn", "by": By.CSS_SELECTOR, "locator": ".card a.btn[href*='/admin/services']", "text": "Manage Services", "href": "/admin/services"},
+    # Navbar
+    {"name": "navbar_home", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href='/']", "text": "Home", "href": "/"},
+    {"name": "navbar_dashboard", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/admin/dashboard']", "text": "Dashboard", "href": "/admin/dashboard"},
+    {"name": "navbar_users", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/admin/users']", "text": "Users", "href": "/admin/users"},
+    {"name": "navbar_services", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/admin/services']", "text": "Services", "href": "/admin/services"},
+    {"name": "navbar_vehicles", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/admin/vehicles']", "text": "Vehicles", "href": "/admin/vehicles"},
+    {"name": "navbar_logout", "by": By.CSS_SELECTOR, "locator": "#navbarNav a.nav-link[href*='/auth/logout']", "text": "Logout", "href": "/auth/logout"},
+    {"name": "footer", "by": By.CLASS_NAME, "locator": "footer"}
+)
+
+_EXPECTED_BY_ROLE = {
+    "unauthenticated": _EXPECTED_UNAUTH,
+    "client": _EXPECTED_CLIENT,
+    "employee": _EXPECTED_EMPLOYEE,
+    "admin": _EXPECTED_ADMIN,
+}
 
 class HomePage:
+    _browsers: Dict[str, subprocess.Popen] = {}
+    _debug_ports: Dict[str, int] = {}
+    SCREEN_RESOLUTIONS = (
+        (1920, 1080), (1366, 768), (1280, 720), (768, 1024), (414, 896), (375, 667)
+    )
+
     def __init__(self, driver: webdriver.Chrome = None):
         self.driver = driver
         self.test_results = {}
+        self._lock = threading.Lock()
+        self._session_cookies: Dict[str, list] = {}
         self.config = self._load_config()
         self.base_url = f"{self.config['base_url']}:{self.config['port']}"
         self.home_url = f"{self.base_url}/"
-        self.screen_resolutions = [
-            (1920, 1080), (1366, 768), (1280, 720), (768, 1024), (414, 896), (375, 667)
-        ]
 
-    def _load_config(self) -> Dict[str, Any]:
-        with open('tests/web_interface_tests/tests_config.json', 'r') as f:
-            return json.load(f)
+    @staticmethod
+    def _load_config() -> Dict[str, Any]:
+        global _CONFIG
+        if _CONFIG is None:
+            with open(CONFIG_PATH, 'r') as f:
+                _CONFIG = json.load(f)
+        return _CONFIG
 
-    def _get_fresh_driver(self):
+    @staticmethod
+    def _profile_args(profile: str) -> list:
+        # Chrome locks a user-data-dir, so concurrent role suites each get their own profile
+        return [f"--user-data-dir={os.path.join(CACHE_DIR, profile)}", "--disk-cache-size=104857600"]
+
+    @staticmethod
+    def _wait_for_devtools_port(process: subprocess.Popen, profile: str, timeout: float = 10) -> int:
+        # Chrome writes the port it actually bound to into the profile once DevTools is listening
+        port_file = os.path.join(CACHE_DIR, profile, "DevToolsActivePort")
+        deadline = time.monotonic() + timeout
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"Chrome for {profile} exited with code {process.returncode} during startup")
+            try:
+                with open(port_file, "r") as f:
+                    port = f.readline().strip()
+                if port:
+                    return int(port)
+            except (OSError, ValueError):
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Chrome for {profile} did not report a debugging port within {timeout}s")
+            time.sleep(0.05)
+
+    @classmethod
+    def setup_once(cls) -> None:
+        """Start one long-lived Chrome per role that drivers attach to instead of launching their own."""
+        if cls._browsers:
+            return
+        # Tabs in one browser share cookies, so each role keeps a browser of its own
+        for profile in _EXPECTED_BY_ROLE:
+            # The profile persists between runs, so drop the port file left by the previous browser
+            try:
+                os.remove(os.path.join(CACHE_DIR, profile, "DevToolsActivePort"))
+            except FileNotFoundError:
+                pass
+            # Port 0 lets Chrome pick a free port, so it never collides with another debugging browser
+            cls._browsers[profile] = subprocess.Popen(
+                [CHROME_BINARY, "--remote-debugging-port=0", *CHROME_ARGS, *cls._profile_args(profile), "about:blank"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        for profile, process in cls._browsers.items():
+            cls._debug_ports[profile] = cls._wait_for_devtools_port(process, profile)
+
+    @classmethod
+    def teardown(cls) -> None:
+        for process in cls._browsers.values():
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        cls._browsers.clear()
+        cls._debug_ports.clear()
+
+    def _get_fresh_driver(self, profile: str = "default"):
         chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-features=PasswordManagerEnabled,PasswordLeakDetection,AutofillKeyedPasswords")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-save-password-bubble")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--incognito")
-        chrome_options.add_experimental_option("prefs", {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False
-        })
-        return webdriver.Chrome(options=chrome_options)
+        chrome_options.page_load_strategy = "eager"
+        if profile in self._debug_ports:
+            # Attach to the browser from setup_once; its launch flags already apply
+            chrome_options.debugger_address = f"127.0.0.1:{self._debug_ports[profile]}"
+        else:
+            for argument in CHROME_ARGS + self._profile_args(profile):
+                chrome_options.add_argument(argument)
+            chrome_options.add_experimental_option("prefs", {
+                "credentials_enable_service": False,
+                "profile.password_manager_enabled": False,
+                "profile.managed_default_content_settings.images": 2
+            })
+        driver = webdriver.Chrome(options=chrome_options)
+        # Home page elements render at once or not at all, so fail fast instead of stalling the suite
+        driver.set_page_load_timeout(5)
+        driver.set_script_timeout(3)
+        driver.implicitly_wait(0)
+        # The profile outlives the driver, so drop any session left over from a previous run
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        # No check asserts on images, icons or fonts, so never fetch them
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return driver
 
     def _log_html_on_error(self, driver, context: str):
         try:
@@ -52,7 +317,8 @@ class HomePage:
             pass
 
     def _save_test_result(self, test_name: str, result: Dict[str, Any]) -> None:
-        self.test_results[test_name] = result
+        with self._lock:
+            self.test_results[test_name] = result
 
     def get_test_results(self) -> Dict[str, Any]:
         return self.test_results
@@ -60,7 +326,7 @@ class HomePage:
     def _login_as(self, user_type: str, driver) -> None:
         login_url = f"{self.base_url}/auth/login"
         driver.get(login_url)
-        wait = WebDriverWait(driver, 5)
+        wait = WebDriverWait(driver, 2)
         username_field = wait.until(EC.presence_of_element_located((By.ID, "username")))
         password_field = wait.until(EC.presence_of_element_located((By.ID, "password")))
         submit_button = wait.until(EC.presence_of_element_located((By.ID, "submit")))
@@ -70,76 +336,82 @@ class HomePage:
         password_field.clear()
         password_field.send_keys(credentials["password"])
         submit_button.click()
-        time.sleep(0.2)
+        wait.until(EC.url_changes(login_url))
+        with self._lock:
+            self._session_cookies[user_type] = driver.get_cookies()
+
+    def _login_with_cookies(self, driver, user_type: str) -> None:
+        # Restores the session captured by the first form login instead of replaying the form
+        cookies = self._session_cookies.get(user_type)
+        if not cookies:
+            self._login_as(user_type, driver)
+            return
+        driver.get(self.base_url)
+        for cookie in cookies:
+            driver.add_cookie(cookie)
+        driver.get(self.home_url)
 
     def _logout(self, driver) -> None:
         try:
             driver.get(f"{self.base_url}/auth/logout")
-            time.sleep(0.2)
         except Exception:
             pass
 
-    def _check_page_load(self, user_type: str) -> Dict[str, Any]:
-        driver = self._get_fresh_driver()
+    def _collect_page_observations(self, driver, user_type: str) -> Dict[str, Any]:
+        # One page load and one script call feed the page load, visibility and elements checks
+        driver.get(self.home_url)
+        specs = {name: dict(self._to_js_locator(by, locator), name=name) for name, by, locator in PAGE_ELEMENTS}
+        for elem in self._get_expected_elements_flat(user_type):
+            specs.setdefault(elem["name"], dict(self._to_js_locator(elem["by"], elem["locator"]), name=elem["name"]))
         try:
-            if user_type != "unauthenticated":
-                self._login_as(user_type, driver)
-            driver.get(self.home_url)
-            time.sleep(0.2)
-            wait = WebDriverWait(driver, 5)
+            WebDriverWait(driver, 2).until(EC.presence_of_element_located((By.CLASS_NAME, "navbar")))
+            elements = driver.execute_script(ELEMENT_PROPS_JS, list(specs.values()))
+            error = None
+        except Exception as e:
+            elements, error = {}, str(e)
+        if error or any(props is None for props in elements.values()):
+            self._log_html_on_error(driver, f"home_{user_type}_observations")
+        return {"elements": elements, "error": error}
+
+    def _check_page_load(self, user_type: str, driver, observations: Dict[str, Any] = None) -> Dict[str, Any]:
+        if observations is None:
+            observations = self._collect_page_observations(driver, user_type)
+        if observations["error"]:
+            result = {"status": "failed", "user_type": user_type, "message": f"Unexpected error: {observations['error']}", "error": observations["error"]}
+        else:
             result = {"status": "passed", "user_type": user_type, "elements_found": {}}
-            elements = [
-                ("navbar", (By.CLASS_NAME, "navbar")),
-                ("welcome_header", (By.XPATH, "//h1[contains(text(), 'Welcome to CarService') or contains(text(), 'CarService') or contains(@class, 'display-4') or contains(@class, 'display')]")),
-                ("footer", (By.CLASS_NAME, "footer")),
-            ]
-            for name, locator in elements:
-                try:
-                    wait.until(EC.presence_of_element_located(locator))
-                    result["elements_found"][name] = {"status": "passed"}
-                except Exception as e:
-                    result["elements_found"][name] = {"status": "failed", "error": str(e)}
+            for name, _, locator in PAGE_ELEMENTS:
+                if observations["elements"].get(name) is None:
+                    result["elements_found"][name] = {"status": "failed", "error": f"Element not found: {locator}"}
                     result["status"] = "failed"
-                    self._log_html_on_error(driver, f"home_{user_type}_{name}")
+                else:
+                    result["elements_found"][name] = {"status": "passed"}
             result["message"] = "Page loaded successfully with all essential elements" if result["status"] == "passed" else f"Some elements missing: {[k for k,v in result['elements_found'].items() if v['status']=='failed']}"
-        except Exception as e:
-            self._log_html_on_error(driver, f"home_{user_type}_page_load")
-            result = {"status": "failed", "user_type": user_type, "message": f"Unexpected error: {str(e)}", "error": str(e)}
-        finally:
-            self._logout(driver)
-            driver.quit()
         self._save_test_result(f"page_load_{user_type}", result)
         return result
 
-    def _check_element_visibility(self, user_type: str) -> Dict[str, Any]:
-        driver = self._get_fresh_driver()
-        try:
-            if user_type != "unauthenticated":
-                self._login_as(user_type, driver)
-            driver.get(self.home_url)
-            time.sleep(0.2)
-            wait = WebDriverWait(driver, 5)
-            elements_to_check = {
-                "navbar": (By.CLASS_NAME, "navbar"),
-                "footer": (By.CLASS_NAME, "footer"),
-                "welcome_header": (By.XPATH, "//h1[contains(text(), 'Welcome to CarService') or contains(text(), 'CarService') or contains(@class, 'display-4') or contains(@class, 'display')]")
-            }
+    def _check_element_visibility(self, user_type: str, driver, observations: Dict[str, Any] = None) -> Dict[str, Any]:
+        if observations is None:
+            observations = self._collect_page_observations(driver, user_type)
+        if observations["error"]:
+            result = {"status": "failed", "user_type": user_type, "message": f"Error checking element visibility: {observations['error']}", "error": observations["error"]}
+        else:
             visibility_results = {}
             status = "passed"
-            for element_name, locator in elements_to_check.items():
-                try:
-                    element = wait.until(EC.presence_of_element_located(locator))
-                    is_visible = element.is_displayed()
-                    is_enabled = element.is_enabled() if hasattr(element, 'is_enabled') else True
-                    visibility_results[element_name] = {
-                        "visible": is_visible,
-                        "enabled": is_enabled,
-                        "status": "passed" if is_visible and is_enabled else "failed"
-                    }
-                    if not (is_visible and is_enabled):
-                        status = "failed"
-                except Exception as e:
-                    visibility_results[element_name] = {"status": "failed", "error": str(e)}
+            for element_name, _, locator in PAGE_ELEMENTS:
+                props = observations["elements"].get(element_name)
+                if props is None:
+                    visibility_results[element_name] = {"status": "failed", "error": f"Element not found: {locator}"}
+                    status = "failed"
+                    continue
+                is_visible = props["visible"]
+                is_enabled = props["enabled"]
+                visibility_results[element_name] = {
+                    "visible": is_visible,
+                    "enabled": is_enabled,
+                    "status": "passed" if is_visible and is_enabled else "failed"
+                }
+                if not (is_visible and is_enabled):
                     status = "failed"
             result = {
                 "status": status,
@@ -147,11 +419,6 @@ class HomePage:
                 "message": "All elements visibility check completed" if status == "passed" else "Some elements not visible or not enabled",
                 "elements": visibility_results
             }
-        except Exception as e:
-            result = {"status": "failed", "user_type": user_type, "message": f"Error checking element visibility: {str(e)}", "error": str(e)}
-        finally:
-            self._logout(driver)
-            driver.quit()
         self._save_test_result(f"element_visibility_{user_type}", result)
         return result
 
@@ -166,132 +433,48 @@ class HomePage:
             'href': oczekiwany href (opcjonalnie)
         }
         """
-        if user_type == "unauthenticated":
-            return [
-                {"name": "header_welcome", "by": By.CSS_SELECTOR, "locator": "h1.display-4", "text": "Welcome to CarService"},
-                {"name": "lead_paragraph", "by": By.CSS_SELECTOR, "locator": "p.lead", "text": "Professional car maintenance and repair services."},
-                {"name": "card_register_title", "by": By.XPATH, "locator": "//h5[contains(., 'Register') and not(contains(., 'User'))]", "text": "Register"},
-                {"name": "card_register_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/auth/register') and contains(., 'Register Now')]", "text": "Register Now", "href": "/auth/register"},
-                {"name": "card_signin_title", "by": By.XPATH, "locator": "//h5[contains(., 'Sign In')]", "text": "Sign In"},
-                {"name": "card_signin_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/auth/login') and contains(., 'Sign In')]", "text": "Sign In", "href": "/auth/login"},
-                {"name": "card_contact_title", "by": By.XPATH, "locator": "//h5[contains(., 'Contact Us')]", "text": "Contact Us"},
-                {"name": "card_contact_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/contact') and contains(., 'Contact Support')]", "text": "Contact Support", "href": "/contact"},
-                {"name": "navbar_home", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/') and contains(normalize-space(.), 'Home')]", "text": "Home", "href": "/"},
-                {"name": "navbar_contact", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/contact') and contains(normalize-space(.), 'Contact')]", "text": "Contact", "href": "/contact"},
-                {"name": "navbar_login", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/auth/login') and contains(normalize-space(.), 'Login')]", "text": "Login", "href": "/auth/login"},
-                {"name": "navbar_register", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/auth/register') and contains(normalize-space(.), 'Register')]", "text": "Register", "href": "/auth/register"},
-                {"name": "footer", "by": By.CLASS_NAME, "locator": "footer"}
-            ]
-        elif user_type == "client":
-            return [
-                {"name": "header_welcome", "by": By.CSS_SELECTOR, "locator": "h1.display-4", "text": "Welcome to CarService"},
-                {"name": "lead_paragraph", "by": By.CSS_SELECTOR, "locator": "p.lead", "text": "Professional car maintenance and repair services."},
-                # My Vehicles card
-                {"name": "card_my_vehicles_title", "by": By.XPATH, "locator": "//h5[contains(., 'My Vehicles')]", "text": "My Vehicles"},
-                {"name": "card_my_vehicles_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/client/vehicles') and contains(., 'View Vehicles')]", "text": "View Vehicles", "href": "/client/vehicles"},
-                # My Services card
-                {"name": "card_my_services_title", "by": By.XPATH, "locator": "//h5[contains(., 'My Services')]", "text": "My Services"},
-                {"name": "card_my_services_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/client/services') and contains(., 'View Services')]", "text": "View Services", "href": "/client/services"},
-                # Request Service card
-                {"name": "card_request_service_title", "by": By.XPATH, "locator": "//h5[contains(., 'Request Service')]", "text": "Request Service"},
-                {"name": "card_request_service_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/client/service-request') and contains(., 'New Service')]", "text": "New Service", "href": "/client/service-request"},
-                # Contact Us card (dla klienta też jest)
-                {"name": "card_contact_title", "by": By.XPATH, "locator": "//h5[contains(., 'Contact Us')]", "text": "Contact Us"},
-                {"name": "card_contact_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/contact') and contains(., 'Contact Support')]", "text": "Contact Support", "href": "/contact"},
-                # Navbar
-                {"name": "navbar_home", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/') and contains(normalize-space(.), 'Home')]", "text": "Home", "href": "/"},
-                {"name": "navbar_contact", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/contact') and contains(normalize-space(.), 'Contact')]", "text": "Contact", "href": "/contact"},
-                {"name": "navbar_my_vehicles", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/client/vehicles') and contains(normalize-space(.), 'My Vehicles')]", "text": "My Vehicles", "href": "/client/vehicles"},
-                {"name": "navbar_my_services", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/client/services') and contains(normalize-space(.), 'My Services')]", "text": "My Services", "href": "/client/services"},
-                {"name": "navbar_request_service", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/client/service-request') and contains(normalize-space(.), 'Request Service')]", "text": "Request Service", "href": "/client/service-request"},
-                {"name": "navbar_logout", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/auth/logout') and contains(normalize-space(.), 'Logout')]", "text": "Logout", "href": "/auth/logout"},
-                {"name": "footer", "by": By.CLASS_NAME, "locator": "footer"}
-            ]
-        elif user_type == "employee":
-            return [
-                {"name": "header_welcome", "by": By.CSS_SELECTOR, "locator": "h1.display-4", "text": "Welcome to CarService"},
-                {"name": "lead_paragraph", "by": By.CSS_SELECTOR, "locator": "p.lead", "text": "Professional car maintenance and repair services."},
-                # Service Management card
-                {"name": "card_service_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'Service Management') and not(contains(., 'User')) and not(contains(., 'Vehicle'))]", "text": "Service Management"},
-                {"name": "card_service_management_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/employee/services') and contains(., 'Manage Services')]"},
-                # Vehicle List card
-                {"name": "card_vehicle_list_title", "by": By.XPATH, "locator": "//h5[contains(., 'Vehicle List')]", "text": "Vehicle List"},
-                {"name": "card_vehicle_list_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/employee/vehicles') and contains(., 'View Vehicles')]", "text": "View Vehicles", "href": "/employee/vehicles"},
-                # Client Management card
-                {"name": "card_client_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'Client Management')]", "text": "Client Management"},
-                {"name": "card_client_management_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/employee/users') and contains(., 'Manage Clients')]", "text": "Manage Clients", "href": "/employee/users"},
-                # Navbar
-                {"name": "navbar_home", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/') and contains(normalize-space(.), 'Home')]", "text": "Home", "href": "/"},
-                {"name": "navbar_dashboard", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/employee/dashboard') and contains(normalize-space(.), 'Dashboard')]", "text": "Dashboard", "href": "/employee/dashboard"},
-                {"name": "navbar_services", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/employee/services') and contains(normalize-space(.), 'Services')]", "text": "Services", "href": "/employee/services"},
-                {"name": "navbar_users", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/employee/users') and contains(normalize-space(.), 'Users')]", "text": "Users", "href": "/employee/users"},
-                {"name": "navbar_vehicles", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/employee/vehicles') and contains(normalize-space(.), 'Vehicles')]", "text": "Vehicles", "href": "/employee/vehicles"},
-                {"name": "navbar_logout", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/auth/logout') and contains(normalize-space(.), 'Logout')]", "text": "Logout", "href": "/auth/logout"},
-                {"name": "footer", "by": By.CLASS_NAME, "locator": "footer"}
-            ]
-        elif user_type == "admin":
-            return [
-                {"name": "header_welcome", "by": By.CSS_SELECTOR, "locator": "h1.display-4", "text": "Welcome to CarService"},
-                {"name": "lead_paragraph", "by": By.CSS_SELECTOR, "locator": "p.lead", "text": "Professional car maintenance and repair services."},
-                # User Management card
-                {"name": "card_user_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'User Management')]", "text": "User Management"},
-                {"name": "card_user_management_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/admin/users') and contains(., 'Manage Users')]", "text": "Manage Users", "href": "/admin/users"},
-                # Vehicle Management card
-                {"name": "card_vehicle_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'Vehicle Management')]", "text": "Vehicle Management"},
-                {"name": "card_vehicle_management_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/admin/vehicles') and contains(., 'Manage Vehicles')]", "text": "Manage Vehicles", "href": "/admin/vehicles"},
-                # Service Management card
-                {"name": "card_service_management_title", "by": By.XPATH, "locator": "//h5[contains(., 'Service Management')]", "text": "Service Management"},
-                {"name": "card_service_management_btn", "by": By.XPATH, "locator": "//a[contains(@href, '/admin/services') and contains(., 'Manage Services')]", "text": "Manage Services", "href": "/admin/services"},
-                # Navbar
-                {"name": "navbar_home", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/') and contains(normalize-space(.), 'Home')]", "text": "Home", "href": "/"},
-                {"name": "navbar_dashboard", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/admin/dashboard') and contains(normalize-space(.), 'Dashboard')]", "text": "Dashboard", "href": "/admin/dashboard"},
-                {"name": "navbar_users", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/admin/users') and contains(normalize-space(.), 'Users')]", "text": "Users", "href": "/admin/users"},
-                {"name": "navbar_services", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/admin/services') and contains(normalize-space(.), 'Services')]", "text": "Services", "href": "/admin/services"},
-                {"name": "navbar_vehicles", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/admin/vehicles') and contains(normalize-space(.), 'Vehicles')]", "text": "Vehicles", "href": "/admin/vehicles"},
-                {"name": "navbar_logout", "by": By.XPATH, "locator": "//div[@id='navbarNav']//a[contains(@class, 'nav-link') and contains(@href, '/auth/logout') and contains(normalize-space(.), 'Logout')]", "text": "Logout", "href": "/auth/logout"},
-                {"name": "footer", "by": By.CLASS_NAME, "locator": "footer"}
-            ]
-        return []
-
-    def _check_elements_flat(self, user_type: str) -> dict:
-        driver = self._get_fresh_driver()
+        return _EXPECTED_BY_ROLE.get(user_type, ())
+
+    @staticmethod
+    def _to_js_locator(by: str, locator: str) -> Dict[str, Any]:
+        if by == By.XPATH:
+            return {"xpath": True, "locator": locator}
+        if by == By.CLASS_NAME:
+            return {"xpath": False, "locator": f".{locator}"}
+        if by == By.ID:
+            return {"xpath": False, "locator": f"#{locator}"}
+        return {"xpath": False, "locator": locator}
+
+    def _check_elements_flat(self, user_type: str, driver, observations: Dict[str, Any] = None) -> dict:
+        if observations is None:
+            observations = self._collect_page_observations(driver, user_type)
         results = {}
-        try:
-            if user_type != "unauthenticated":
-                self._login_as(user_type, driver)
-            driver.get(self.home_url)
-            time.sleep(0.2)
-            wait = WebDriverWait(driver, 5)
-            expected_elements = self._get_expected_elements_flat(user_type)
-            for elem in expected_elements:
-                name = elem["name"]
-                by = elem["by"]
-                locator = elem["locator"]
-                try:
-                    web_elem = wait.until(EC.presence_of_element_located((by, locator)))
-                    is_visible = web_elem.is_displayed()
-                    result = {"status": "passed" if is_visible else "failed", "visible": is_visible}
-                    if "text" in elem:
-                        actual_text = web_elem.text.strip()
-                        expected_text = elem["text"].strip()
-                        result["text_match"] = (expected_text in actual_text)
-                        result["actual_text"] = actual_text
-                        result["expected_text"] = expected_text
-                        if not result["text_match"]:
-                            result["status"] = "failed"
-                    if "href" in elem:
-                        actual_href = web_elem.get_attribute("href")
-                        result["href_match"] = (elem["href"] in actual_href) if actual_href else False
-                        result["actual_href"] = actual_href
-                        result["expected_href"] = elem["href"]
-                        if not result["href_match"]:
-                            result["status"] = "failed"
-                except Exception as e:
-                    result = {"status": "failed", "error": str(e)}
-                results[name] = result
-        finally:
-            self._logout(driver)
-            driver.quit()
+        found = observations["elements"]
+        lookup_error = observations["error"]
+        for elem in self._get_expected_elements_flat(user_type):
+            name = elem["name"]
+            props = found.get(name)
+            if props is None:
+                results[name] = {"status": "failed", "error": lookup_error or f"Element not found: {elem['locator']}"}
+                continue
+            is_visible = props["visible"]
+            result = {"status": "passed" if is_visible else "failed", "visible": is_visible}
+            if "text" in elem:
+                actual_text = (props["text"] or "").strip()
+                expected_text = elem["text"].strip()
+                result["text_match"] = (expected_text in actual_text)
+                result["actual_text"] = actual_text
+                result["expected_text"] = expected_text
+                if not result["text_match"]:
+                    result["status"] = "failed"
+            if "href" in elem:
+                actual_href = props["href"]
+                result["href_match"] = (elem["href"] in actual_href) if actual_href else False
+                result["actual_href"] = actual_href
+                result["expected_href"] = elem["href"]
+                if not result["href_match"]:
+                    result["status"] = "failed"
+            results[name] = result
         overall_status = "passed" if all(r["status"] == "passed" for r in results.values()) else "failed"
         summary = {
             "status": overall_status,
@@ -302,22 +485,31 @@ class HomePage:
         self._save_test_result(f"elements_flat_{user_type}", summary)
         return summary
 
-    def _test_scrolling(self, user_type: str) -> Dict[str, Any]:
-        driver = self._get_fresh_driver()
+    def _wait_for_scroll_to_settle(self, driver) -> int:
+        # Smooth scrolling keeps moving after scrollTo returns, so poll until two reads agree
+        offsets = []
+
+        def settled(d):
+            offsets.append(d.execute_script("return window.pageYOffset;"))
+            return len(offsets) > 1 and offsets[-1] == offsets[-2]
+
+        try:
+            WebDriverWait(driver, 2, poll_frequency=0.05).until(settled)
+        except TimeoutException:
+            pass
+        return offsets[-1]
+
+    def _test_scrolling(self, user_type: str, driver) -> Dict[str, Any]:
         try:
-            if user_type != "unauthenticated":
-                self._login_as(user_type, driver)
             driver.get(self.home_url)
+            # Eager loading returns before stylesheets apply, and scroll height depends on layout
+            WebDriverWait(driver, 3).until(lambda d: d.execute_script("return document.readyState") == "complete")
             driver.set_window_size(375, 667)
-            time.sleep(0.1)
-            initial_scroll = driver.execute_script("return window.pageYOffset;")
+            initial_scroll = self._wait_for_scroll_to_settle(driver)
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.1)
-            bottom_scroll = driver.execute_script("return window.pageYOffset;")
+            bottom_scroll = self._wait_for_scroll_to_settle(driver)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(0.1)
-            final_scroll = driver.execute_script("return window.pageYOffset;")
-            driver.set_window_size(1920, 1080)
+            final_scroll = self._wait_for_scroll_to_settle(driver)
             result = {
                 "status": "passed",
                 "user_type": user_type,
@@ -331,54 +523,53 @@ class HomePage:
         except Exception as e:
             result = {"status": "failed", "user_type": user_type, "message": f"Error during scrolling test: {str(e)}", "error": str(e)}
         finally:
-            self._logout(driver)
-            driver.quit()
+            driver.set_window_size(1920, 1080)
         self._save_test_result(f"scrolling_{user_type}", result)
         return result
 
-    def _check_links_redirect(self, user_type: str) -> dict:
-        driver = self._get_fresh_driver()
+    def _check_links_redirect(self, user_type: str, driver) -> dict:
         results = {}
         try:
-            if user_type != "unauthenticated":
-                self._login_as(user_type, driver)
             driver.get(self.home_url)
-            time.sleep(0.2)
-            wait = WebDriverWait(driver, 5)
-            expected_elements = self._get_expected_elements_flat(user_type)
-            for elem in expected_elements:
+            WebDriverWait(driver, 2).until(EC.presence_of_element_located((By.CLASS_NAME, "navbar")))
+            links = []
+            allowed_by_name = {}
+            for elem in self._get_expected_elements_flat(user_type):
                 if "href" not in elem:
                     continue
                 name = elem["name"]
-                by = elem["by"]
-                locator = elem["locator"]
-                expected_href = elem["href"]
-
-                allowed_urls = [expected_href]
+                allowed_urls = [elem["href"]]
                 if name in ["navbar_logout"]:
                     allowed_urls.append("/")
                 if name in ["navbar_request_service", "card_request_service_btn"] and user_type == "client":
                     allowed_urls.append("/client/vehicles")
-                try:
-                    web_elem = wait.until(EC.element_to_be_clickable((by, locator)))
-                    web_elem.click()
-                    time.sleep(0.3)
-                    current_url = driver.current_url
-                    # Sprawdź czy przekierowanie jest poprawne
-                    passed = any(url in current_url for url in allowed_urls)
-                    results[name] = {
-                        "status": "passed" if passed else "failed",
-                        "expected_href": allowed_urls,
-                        "actual_url": current_url,
-                        "message": "Redirect OK" if passed else f"Expected one of {allowed_urls} in '{current_url}'"
-                    }
-                    driver.get(self.home_url)
-                    time.sleep(0.2)
-                except Exception as e:
-                    results[name] = {"status": "failed", "error": str(e)}
+                allowed_by_name[name] = allowed_urls
+                links.append(dict(self._to_js_locator(elem["by"], elem["locator"]), name=name, last=name == "navbar_logout"))
+            # Following redirects in-page gives the same final URL a click would, without navigating
+            try:
+                probes = driver.execute_async_script(LINK_REDIRECTS_JS, links)
+            except Exception as e:
+                probes = [{"name": link["name"], "error": str(e)} for link in links]
+            for probe in probes:
+                name = probe["name"]
+                allowed_urls = allowed_by_name[name]
+                if "error" in probe:
+                    results[name] = {"status": "failed", "error": probe["error"]}
+                    continue
+                current_url = probe["url"]
+                # Sprawdź czy przekierowanie jest poprawne
+                passed = any(url in current_url for url in allowed_urls)
+                results[name] = {
+                    "status": "passed" if passed else "failed",
+                    "expected_href": allowed_urls,
+                    "actual_url": current_url,
+                    "http_status": probe["http_status"],
+                    "message": "Redirect OK" if passed else f"Expected one of {allowed_urls} in '{current_url}'"
+                }
         finally:
-            self._logout(driver)
-            driver.quit()
+            # The logout link ends the session, so restore it for the remaining checks
+            if user_type != "unauthenticated":
+                self._login_with_cookies(driver, user_type)
         overall_status = "passed" if all(r["status"] == "passed" for r in results.values()) else "failed"
         summary = {
             "status": overall_status,
@@ -389,79 +580,68 @@ class HomePage:
         self._save_test_result(f"links_redirect_{user_type}", summary)
         return summary
 
-    def test_as_unauthenticated(self) -> Dict[str, Any]:
-        results = {
-            "page_load": self._check_page_load("unauthenticated"),
-            "element_visibility": self._check_element_visibility("unauthenticated"),
-            "elements_flat": self._check_elements_flat("unauthenticated"),
-            "links_redirect": self._check_links_redirect("unauthenticated"),
-            "scrolling": self._test_scrolling("unauthenticated"),
+    def _run_role(self, role: str) -> Dict[str, Any]:
+        results = {}
+        driver = observations = None
+        # Built up front so a failed setup can still report every check; the lambdas
+        # read driver and observations only when called
+        checks = {
+            "page_load": lambda: self._check_page_load(role, driver, observations),
+            "element_visibility": lambda: self._check_element_visibility(role, driver, observations),
+            "elements_flat": lambda: self._check_elements_flat(role, driver, observations),
+            "links_redirect": lambda: self._check_links_redirect(role, driver),
+            "scrolling": lambda: self._test_scrolling(role, driver),
         }
-        self._save_test_result("unauthenticated_tests", results)
+        try:
+            driver = self._get_fresh_driver(role)
+            if role != "unauthenticated":
+                self._login_as(role, driver)
+            observations = self._collect_page_observations(driver, role)
+            for name, check in checks.items():
+                try:
+                    results[name] = check()
+                except Exception as e:
+                    results[name] = {"status": "failed", "user_type": role, "message": f"Unexpected error: {str(e)}", "error": str(e)}
+        except Exception as e:
+            # A failed driver start, login or page load fails every check of this role, not the whole run
+            if driver is not None:
+                self._log_html_on_error(driver, f"home_{role}_setup")
+            for name in checks:
+                results.setdefault(name, {"status": "failed", "user_type": role, "message": f"Role setup failed: {str(e)}", "error": str(e)})
+        finally:
+            if driver is not None:
+                driver.quit()
+        self._save_test_result(f"{role}_tests", results)
         return results
 
+    def test_as_unauthenticated(self) -> Dict[str, Any]:
+        return self._run_role("unauthenticated")
+
     def test_as_client(self) -> Dict[str, Any]:
-        results = {
-            "page_load": self._check_page_load("client"),
-            "element_visibility": self._check_element_visibility("client"),
-            "elements_flat": self._check_elements_flat("client"),
-            "links_redirect": self._check_links_redirect("client"),
-            "scrolling": self._test_scrolling("client"),
-        }
-        self._save_test_result("client_tests", results)
-        return results
+        return self._run_role("client")
 
     def test_as_employee(self) -> Dict[str, Any]:
-        results = {
-            "page_load": self._check_page_load("employee"),
-            "element_visibility": self._check_element_visibility("employee"),
-            "elements_flat": self._check_elements_flat("employee"),
-            "links_redirect": self._check_links_redirect("employee"),
-            "scrolling": self._test_scrolling("employee"),
-        }
-        self._save_test_result("employee_tests", results)
-        return results
+        return self._run_role("employee")
 
     def test_as_admin(self) -> Dict[str, Any]:
-        results = {
-            "page_load": self._check_page_load("admin"),
-            "element_visibility": self._check_element_visibility("admin"),
-            "elements_flat": self._check_elements_flat("admin"),
-            "links_redirect": self._check_links_redirect("admin"),
-            "scrolling": self._test_scrolling("admin"),
-        }
-        self._save_test_result("admin_tests", results)
-        return results
+        return self._run_role("admin")
 
     def run_all_tests(self) -> Dict[str, Any]:
-        all_results = {
-            "unauthenticated": self.test_as_unauthenticated(),
-            "client": self.test_as_client(),
-            "employee": self.test_as_employee(),
-            "admin": self.test_as_admin()
+        suites = {
+            "unauthenticated": self.test_as_unauthenticated,
+            "client": self.test_as_client,
+            "employee": self.test_as_employee,
+            "admin": self.test_as_admin,
         }
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {user_type: executor.submit(suite) for user_type, suite in suites.items()}
+            all_results = {user_type: future.result() for user_type, future in futures.items()}
         self._save_test_result("all_tests", all_results)
         return all_results
 
     def print_test_results(self, results: Dict[str, Any], indent: int = 0) -> None:
-        indent_str = "  " * indent
-        for key, value in results.items():
-            if isinstance(value, dict):
-                if "status" in value:
-                    status_color = "\033[92m" if value["status"] == "passed" else "\033[91m"
-                    print(f"{indent_str}{key}: {status_color}{value['status']}\033[0m")
-                    if "message" in value:
-                        print(f"{indent_str}  Message: {value['message']}")
-                    if "error" in value:
-                        print(f"{indent_str}  Error: {value['error']}")
-                    for subkey in [k for k in value if isinstance(value[k], dict)]:
-                        print(f"{indent_str}  {subkey}:")
-                        self.print_test_results(value[subkey], indent + 2)
-                else:
-                    print(f"{indent_str}{key}:")
-                    self.print_test_results(value, indent + 1)
-            else:
-                print(f"{indent_str}{key}: {value}")
+        # Render into memory and emit once so output is not interleaved line by line
+        sys.stdout.write("".join(line + "\n" for line in iter_result_lines(results, indent)))
 
 if __name__ == "__main__":
     chrome_options = Options()
@@ -470,6 +650,7 @@ if __name__ == "__main__":
     chrome_options.add_argument("--disable-dev-shm-usage")
     driver = webdriver.Chrome(options=chrome_options)
     try:
+        HomePage.setup_once()
         home_page = HomePage(driver)
         results = home_page.run_all_tests()
         print("\nTest Results:")
@@ -477,3 +658,4 @@ if __name__ == "__main__":
         home_page.print_test_results(results)
     finally:
         driver.quit()
+        HomePage.teardown()
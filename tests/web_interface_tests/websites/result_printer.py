@@ -0,0 +1,40 @@
+"""
+Shared console output for the nested result dicts returned by the page test classes
+"""
+
+from typing import Any, Dict, Iterator
+
+GREEN, YELLOW, RED, RESET = "\033[92m", "\033[93m", "\033[91m", "\033[0m"
+
+INDENTS = ["  " * i for i in range(16)]
+
+def iter_result_lines(results: Dict[str, Any], indent: int = 0, status_colors: Dict[str, str] = None) -> Iterator[str]:
+    """Yield the printable lines of a results dict; statuses missing from status_colors are shown in red."""
+    status_colors = status_colors or {"passed": GREEN}
+    # Each stack entry is (indent, items iterator, headers_only); headers_only
+    # entries hold the nested dicts of a status dict, printed as "subkey:" blocks
+    stack = [(indent, iter(results.items()), False)]
+    while stack:
+        level, items, headers_only = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            continue
+        key, value = item
+        prefix = INDENTS[level] if level < len(INDENTS) else "  " * level
+        if headers_only:
+            yield f"{prefix}{key}:"
+            stack.append((level + 1, iter(value.items()), False))
+        elif not isinstance(value, dict):
+            yield f"{prefix}{key}: {value}"
+        elif "status" in value:
+            color = status_colors.get(value["status"], RED)
+            yield f"{prefix}{key}: {color}{value['status']}{RESET}"
+            if "message" in value:
+                yield f"{prefix}  Message: {value['message']}"
+            if "error" in value:
+                yield f"{prefix}  Error: {value['error']}"
+            stack.append((level + 1, ((k, v) for k, v in value.items() if isinstance(v, dict)), True))
+        else:
+            yield f"{prefix}{key}:"
+            stack.append((level + 1, iter(value.items()), False))